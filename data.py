@@ -1,23 +1,196 @@
 import hashlib
 import json
+import mmap
+import operator
 import os
+import pickle
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 
+import pandas as pd
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 
 DEFAULT_REPORTS_DIR = "/home/monad/workload-reports"
 
-VersionBounds = Dict[str, Dict[str, datetime]]
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "txdash")
+# Bump when RunRow's shape or derivation changes so stale pickles are ignored.
+_CACHE_VERSION = 9
 
+# Per-file derived-row cache: path -> (mtime_ns, size, row or None for files
+# that failed to derive). Reports are immutable once written, so a matching
+# (mtime_ns, size) pair means the cached row is still valid.
+RowCache = Dict[str, Tuple[int, int, Optional["RunRow"]]]
+
+# In-process mirror of the on-disk row cache, keyed by reports dir. After a
+# "Reload reports" click (which clears the st.cache_data layer) the rescan
+# only stats files and parses the delta, without re-reading the pickle.
+_ROW_CACHES: Dict[str, RowCache] = {}
+
+VersionBounds = Dict[str, Dict[str, datetime]]
 
-@dataclass
+# orjson parses bytes directly (no text decode) and is several times faster
+# than stdlib json; fall back to stdlib when it is not installed.
+_loads = orjson.loads if orjson is not None else json.loads
+
+if orjson is not None:
+    _dumps = orjson.dumps
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+# Slow-path normalizer for timestamps the slicing fast path can't handle.
+_RFC3339_RE = re.compile(
+    r"^(?P<base>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?P<f>\.\d+)?(?P<tz>[+-]\d{2}:\d{2})$"
+)
+
+
+@lru_cache(maxsize=256)
+def _decode_stats(raw: bytes) -> Dict[str, Any]:
+    # Keyed on the raw bytes so repeated property reads within a render hit
+    # the cache; bounded so the detail view's working set stays small.
+    return _loads(raw)
+
+# One parser per loader thread: a pysimdjson Parser recycles its internal
+# buffer between parses, but refuses to re-parse while proxies from a
+# previous document are alive — which another pool worker may still hold.
+# Thread-local instances keep the buffer reuse without the shared-state
+# race. Same-thread reuse is safe because _parse_report materializes
+# everything it returns before the next call.
+_SIMD_LOCAL = threading.local()
+
+
+def _simd_parser() -> "simdjson.Parser":
+    parser = getattr(_SIMD_LOCAL, "parser", None)
+    if parser is None:
+        parser = simdjson.Parser()
+        _SIMD_LOCAL.parser = parser
+    return parser
+
+# Top-level scalar fields that _derive_row actually reads.
+_REPORT_SCALAR_FIELDS = (
+    "start_time",
+    "end_time",
+    "workload_idx",
+    "target_tps",
+    "txs_sent",
+    "txs_committed",
+    "txs_dropped",
+    "client_version",
+    "stats_str",
+)
+
+
+def _parse_report(buf: Union[bytes, memoryview]) -> Dict[str, Any]:
+    """Parse a report, materializing only the fields _derive_row consumes.
+
+    With pysimdjson available the document stays a lazy DOM and we project
+    out the handful of scalars plus the selected workload group and `stats`;
+    converting the full tree into Python dicts is the dominant JSON cost for
+    large reports. Without simdjson, fall back to a full orjson/json parse.
+    """
+    if simdjson is None:
+        if orjson is None and not isinstance(buf, (bytes, bytearray)):
+            buf = bytes(buf)  # stdlib json cannot read buffer objects
+        return _loads(buf)
+    doc = _simd_parser().parse(buf)
+    data: Dict[str, Any] = {}
+    for field in _REPORT_SCALAR_FIELDS:
+        try:
+            data[field] = doc.at_pointer("/" + field)
+        except (KeyError, ValueError):
+            continue
+    try:
+        idx = int(data.get("workload_idx", 0))
+    except (TypeError, ValueError):
+        idx = 0
+    if idx >= 0:
+        try:
+            group = doc.at_pointer(f"/config/workload_groups/{idx}")
+            if hasattr(group, "as_dict"):
+                group = group.as_dict()
+            data["config"] = {"workload_groups": [None] * idx + [group]}
+        except (KeyError, IndexError, ValueError):
+            pass
+    try:
+        stats_obj = doc.at_pointer("/stats")
+        if hasattr(stats_obj, "keys"):
+            # Materialize only each metric's `overall` block straight off
+            # the lazy DOM; the windowed samples are never rendered.
+            projected: Dict[str, Any] = {}
+            for key in stats_obj.keys():
+                try:
+                    overall = doc.at_pointer(f"/stats/{key}/overall")
+                except (KeyError, TypeError, ValueError):
+                    projected[key] = {}
+                    continue
+                if hasattr(overall, "as_dict"):
+                    overall = overall.as_dict()
+                projected[key] = {"overall": overall}
+            data["stats"] = projected
+        else:
+            data["stats"] = stats_obj
+    except (KeyError, ValueError):
+        pass
+    return data
+
+
+@dataclass(frozen=True)
 class RunRow:
+    # Rows are immutable once derived. Explicit __slots__ (rather than
+    # slots=True, which needs 3.10) drops the per-instance __dict__ —
+    # roughly 40% less memory per row and faster attribute access; safe
+    # here because no field has a default.
+    __slots__ = (
+        "file",
+        "start",
+        "start_str",
+        "end",
+        "duration_s",
+        "workload_idx",
+        "workload_name",
+        "workload_config",
+        "workload_config_hash",
+        "gen_mode",
+        "client_version",
+        "target_tps",
+        "txs_sent",
+        "txs_committed",
+        "txs_dropped",
+        "achieved_tps",
+        "drop_rate",
+        "stats_raw",
+        "stats_str",
+        "search_blob",
+        "stat_keys",
+    )
+
     file: str
     start: datetime
+    # start rendered as UTC "%Y-%m-%d %H:%M", formatted once at derive time;
+    # strftime is slow enough to matter when every rerun labels every row.
+    start_str: str
     end: datetime
     duration_s: float
     workload_idx: int
@@ -32,32 +205,99 @@ class RunRow:
     txs_dropped: int
     achieved_tps: float
     drop_rate: float
-    stats: Dict[str, Any]
+    # Prometheus stats as minified JSON bytes; most rows never have their
+    # stats rendered, so the dict tree is only built on access via `stats`.
+    stats_raw: bytes
     stats_str: str
+    # Lowercased "name genmode basename hash" blob, precomputed so the
+    # overview search box does not rebuild it per row on every rerun.
+    search_blob: str
+    # Metric names, captured at derive time so listing keys never has to
+    # decode stats_raw.
+    stat_keys: FrozenSet[str]
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        if not self.stats_raw:
+            return {}
+        return _decode_stats(self.stats_raw)
+
+    # With __slots__ there is no instance __dict__ for pickle to restore
+    # state into, and the frozen __setattr__ rejects the setattr fallback;
+    # mirror what dataclass(slots=True) generates on 3.10+.
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@lru_cache(maxsize=8192)
+def _parse_rfc3339(s: str) -> datetime:
+    # Timestamps repeat across report files; datetimes are immutable, so a
+    # cache hit replaces the whole normalize+parse with one dict lookup.
+    # On Python 3.11+ fromisoformat accepts the `Z` suffix and truncates
+    # nanosecond fractions itself, so the raw string parses directly.
+    try:
+        dt = datetime.fromisoformat(s)
+    except ValueError:
+        return _parse_rfc3339_normalized(s)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
 
 
-def _parse_rfc3339(s: str) -> datetime:
-    # Normalize RFC3339 timestamps that may contain nanoseconds (9 digits)
-    # to Python's datetime.fromisoformat-compatible microseconds (max 6 digits).
+def _parse_rfc3339_normalized(s: str) -> datetime:
+    # Pre-3.11 fallback: normalize RFC3339 timestamps that may contain
+    # nanoseconds (9 digits) to fromisoformat-compatible microseconds.
     if s.endswith("Z"):
         s = s[:-1] + "+00:00"
-    match = re.match(
-        r"^(?P<base>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?P<f>\.\d+)?(?P<tz>[+-]\d{2}:\d{2})$",
-        s,
-    )
-    if match:
-        fraction = match.group("f") or ""
-        if fraction:
-            digits = fraction[1:]
-            if len(digits) > 6:
-                fraction = "." + digits[:6]
-        s = match.group("base") + fraction + match.group("tz")
-    dt = datetime.fromisoformat(s)
+    # Fast path: the RFC3339 layout is rigid, so any fractional part starts
+    # at index 19 and runs to the timezone sign; truncating it to 6 digits
+    # needs only slicing, no regex.
+    if len(s) > 19 and s[19] == ".":
+        tz_idx = s.rfind("+", 19)
+        if tz_idx < 0:
+            tz_idx = s.rfind("-", 19)
+        if tz_idx < 0:
+            tz_idx = len(s)
+        if tz_idx - 19 > 7:
+            s = s[:26] + s[tz_idx:]
+    try:
+        dt = datetime.fromisoformat(s)
+    except ValueError:
+        # Slow path for timestamps that deviate from the fixed-width layout.
+        match = _RFC3339_RE.match(s)
+        if match:
+            fraction = match.group("f") or ""
+            if fraction:
+                digits = fraction[1:]
+                if len(digits) > 6:
+                    fraction = "." + digits[:6]
+            s = match.group("base") + fraction + match.group("tz")
+        dt = datetime.fromisoformat(s)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt
 
 
+def _project_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only each metric's `overall` block — all the UI ever reads.
+
+    Windowed samples and echoed metadata are dropped before the stats are
+    serialized onto RunRow, shrinking the cached payload several-fold.
+    """
+    projected: Dict[str, Any] = {}
+    for key, value in stats.items():
+        if isinstance(value, dict):
+            overall = value.get("overall")
+            projected[key] = {"overall": overall} if overall is not None else {}
+        else:
+            projected[key] = value
+    return projected
+
+
 def _gen_mode_label(gen_mode_val: Any) -> str:
     # Serde external-tagged enum: may be a string (unit variant) or {Variant: payload}
     if isinstance(gen_mode_val, str):
@@ -67,18 +307,36 @@ def _gen_mode_label(gen_mode_val: Any) -> str:
     return "unknown"
 
 
-def _sanitize_for_hash(value: Any) -> Any:
-    if isinstance(value, dict):
-        return {k: _sanitize_for_hash(value[k]) for k in sorted(value.keys())}
-    if isinstance(value, list):
-        return [_sanitize_for_hash(v) for v in value]
-    return value
+# Identical workload configs recur across many runs in a reports dir;
+# intern the digest per canonical encoding so each unique config is hashed
+# once per process. Racy inserts from loader threads only cost a duplicate
+# computation. Capped crudely since K (unique configs) is small in practice.
+_WORKLOAD_HASH_CACHE: Dict[bytes, str] = {}
 
 
 def _compute_workload_hash(workload_cfg: Dict[str, Any]) -> str:
-    sanitized = _sanitize_for_hash(workload_cfg)
-    canonical = json.dumps(sanitized, separators=(",", ":"), sort_keys=True)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    # The hash is only an identity key for grouping identical configs, so a
+    # fast non-cryptographic digest is enough. Both variants emit 32 hex
+    # chars, plenty for the [:8]/[:12] truncations used in the UI. The
+    # encoders sort keys recursively themselves, so no pre-sorted copy of
+    # the tree is needed.
+    if orjson is not None:
+        canonical = orjson.dumps(workload_cfg, option=orjson.OPT_SORT_KEYS)
+    else:
+        canonical = json.dumps(
+            workload_cfg, separators=(",", ":"), sort_keys=True, ensure_ascii=False
+        ).encode("utf-8")
+    cached = _WORKLOAD_HASH_CACHE.get(canonical)
+    if cached is not None:
+        return cached
+    if xxhash is not None:
+        digest = xxhash.xxh3_128(canonical).hexdigest()
+    else:
+        digest = hashlib.blake2b(canonical, digest_size=16).hexdigest()
+    if len(_WORKLOAD_HASH_CACHE) >= 4096:
+        _WORKLOAD_HASH_CACHE.clear()
+    _WORKLOAD_HASH_CACHE[canonical] = digest
+    return digest
 
 
 def _derive_row(data: Dict[str, Any], file: str) -> Optional[RunRow]:
@@ -97,8 +355,11 @@ def _derive_row(data: Dict[str, Any], file: str) -> Optional[RunRow]:
             workload_cfg = workload_groups[workload_idx] or {}
             workload_name = workload_cfg.get("name", workload_name)
 
-        workload_config_copy = json.loads(json.dumps(workload_cfg)) if workload_cfg else {}
-        workload_hash = _compute_workload_hash(workload_config_copy) if workload_cfg else ""
+        # The config sub-dict comes from this file's own parse and nothing
+        # downstream mutates it, so storing the reference is safe — no need
+        # for the old json round-trip deep copy.
+        workload_config = workload_cfg or {}
+        workload_hash = _compute_workload_hash(workload_config) if workload_cfg else ""
 
         gen_mode = "unknown"
         traffic_gens = workload_cfg.get("traffic_gens", []) if workload_cfg else []
@@ -113,18 +374,24 @@ def _derive_row(data: Dict[str, Any], file: str) -> Optional[RunRow]:
         achieved_tps = (txs_committed / duration_s) if duration_s > 0 else 0.0
         drop_rate = (txs_dropped / txs_sent) if txs_sent > 0 else 0.0
 
-        stats = data.get("stats", {}) or {}
+        stats = _project_stats(data.get("stats", {}) or {})
+        stats_raw = _dumps(stats) if stats else b""
         stats_str = data.get("stats_str", "") or ""
         client_version = data.get("client_version") or "Unknown"
 
+        search_blob = " ".join(
+            [workload_name, gen_mode, os.path.basename(file), workload_hash]
+        ).lower()
+
         return RunRow(
             file=file,
             start=start,
+            start_str=start.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M"),
             end=end,
             duration_s=duration_s,
             workload_idx=workload_idx,
             workload_name=workload_name,
-            workload_config=workload_config_copy,
+            workload_config=workload_config,
             workload_config_hash=workload_hash,
             gen_mode=gen_mode,
             client_version=client_version,
@@ -134,17 +401,102 @@ def _derive_row(data: Dict[str, Any], file: str) -> Optional[RunRow]:
             txs_dropped=txs_dropped,
             achieved_tps=achieved_tps,
             drop_rate=drop_rate,
-            stats=stats,
+            stats_raw=stats_raw,
             stats_str=stats_str,
+            search_blob=search_blob,
+            stat_keys=frozenset(stats),
         )
     except Exception as exc:
         print(f"Error deriving row from {file}: {exc}")
         return None
 
 
-def _is_report_file(path: str) -> bool:
-    name = os.path.basename(path)
-    return name.endswith(".json") and "-report-" in name
+def _iter_report_files(dir_path: str) -> Iterator[Tuple[str, os.stat_result]]:
+    # os.scandir exposes entry names and types without the extra stat and
+    # basename allocation os.walk + os.path.basename incur per entry. The
+    # stat result rides along so the caller's mtime/size cache check does
+    # not issue a second stat per file.
+    try:
+        entries = os.scandir(dir_path)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_report_files(entry.path)
+            elif name.endswith(".json") and "-report-" in name and entry.is_file():
+                try:
+                    yield entry.path, entry.stat()
+                except OSError:
+                    continue
+
+
+# Below this size the mmap setup costs more than it saves.
+_MMAP_THRESHOLD = 1 << 14
+
+
+def _advise_sequential(fd: int) -> None:
+    # Reports are consumed front to back in a single pass; tell the kernel
+    # so it prefetches aggressively and keeps the disk queue full while the
+    # worker threads parse.
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _load_one(path: str, mtime_ns: int, size: int) -> Optional[Tuple[str, int, int, Optional["RunRow"]]]:
+    try:
+        if size >= _MMAP_THRESHOLD:
+            # Zero-copy: the parser reads straight from the page cache
+            # instead of through an intermediate bytes object.
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                _advise_sequential(fd)
+                with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as buf:
+                    view = memoryview(buf)
+                    try:
+                        data = _parse_report(view)
+                    finally:
+                        # The mmap cannot close while a view is exported.
+                        view.release()
+            finally:
+                os.close(fd)
+        else:
+            with open(path, "rb") as handle:
+                _advise_sequential(handle.fileno())
+                data = _parse_report(handle.read())
+        return path, mtime_ns, size, _derive_row(data, path)
+    except Exception as exc:
+        print(f"Error loading {path}: {exc}")
+        return None
+
+
+def _row_cache_path(dir_path: str) -> str:
+    digest = hashlib.sha256(os.path.abspath(dir_path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(_CACHE_DIR, f"rows-v{_CACHE_VERSION}-{digest}.pkl")
+
+
+def _load_row_cache(dir_path: str) -> RowCache:
+    try:
+        with open(_row_cache_path(dir_path), "rb") as handle:
+            return pickle.load(handle)
+    except (OSError, EOFError, pickle.PickleError, AttributeError, TypeError):
+        return {}
+
+
+def _save_row_cache(dir_path: str, cache: RowCache) -> None:
+    path = _row_cache_path(dir_path)
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as handle:
+            pickle.dump(cache, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError as exc:
+        print(f"Error writing report cache {path}: {exc}")
 
 
 @st.cache_data(show_spinner=False)
@@ -153,36 +505,137 @@ def load_reports(dir_path: str) -> List[RunRow]:
     rows: List[RunRow] = []
     if not os.path.isdir(dir_path):
         return rows
-    for root, _dirs, files in os.walk(dir_path):
-        for name in files:
-            path = os.path.join(root, name)
-            if not _is_report_file(path):
-                continue
-            try:
-                with open(path, "r", encoding="utf-8") as handle:
-                    data = json.load(handle)
-                row = _derive_row(data, path)
+    cache = _ROW_CACHES.get(dir_path)
+    if cache is None:
+        cache = _load_row_cache(dir_path)
+    fresh: RowCache = {}
+    to_parse: List[Tuple[str, int, int]] = []
+    cached_hits = 0
+    for path, stat in _iter_report_files(dir_path):
+        cached = cache.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            fresh[path] = cached
+            cached_hits += 1
+            if cached[2] is not None:
+                rows.append(cached[2])
+            continue
+        to_parse.append((path, stat.st_mtime_ns, stat.st_size))
+    parsed = len(to_parse)
+    if to_parse:
+        # Each file is independent and orjson/simdjson release the GIL during
+        # parse, so reads and parses overlap across workers. Oversubscribe
+        # relative to core count: the workers spend most of their time in
+        # blocking I/O when reports live on slow or networked storage.
+        workers = min(32, (os.cpu_count() or 4) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_load_one, *item) for item in to_parse]
+            for future in as_completed(futures):
+                result = future.result()
+                if result is None:
+                    continue
+                path, mtime_ns, size, row = result
+                fresh[path] = (mtime_ns, size, row)
                 if row is not None:
                     rows.append(row)
-            except Exception as exc:
-                print(f"Error loading {path}: {exc}")
-                continue
-    rows.sort(key=lambda r: r.start, reverse=True)
-    print(f"Loaded {len(rows)} reports")
+    _ROW_CACHES[dir_path] = fresh
+    if parsed > 0 or len(fresh) != len(cache):
+        _save_row_cache(dir_path, fresh)
+    rows.sort(key=operator.attrgetter("start"), reverse=True)
+    print(f"Loaded {len(rows)} reports ({parsed} parsed, {cached_hits} cached)")
     return rows
 
 
-def compute_version_bounds(rows: Iterable[RunRow]) -> VersionBounds:
-    bounds: VersionBounds = {}
-    for row in rows:
-        version = row.client_version or "Unknown"
-        start = row.start
-        entry = bounds.setdefault(version, {"earliest": start, "latest": start})
-        if start < entry["earliest"]:
-            entry["earliest"] = start
-        if start > entry["latest"]:
-            entry["latest"] = start
-    return bounds
+@st.cache_data(show_spinner=False)
+def load_reports_df(dir_path: str) -> pd.DataFrame:
+    """Columnar (SoA) view of the scalar RunRow fields.
+
+    Filtering, sorting, and table building in the overview page operate on
+    whole columns at once instead of iterating Python objects row by row.
+    Rows are ordered by start descending, matching load_reports. Heavy
+    nested fields (workload_config, stats) stay on the RunRow list.
+    """
+    rows = load_reports(dir_path)
+    return pd.DataFrame(
+        {
+            "file": [r.file for r in rows],
+            "basename": [os.path.basename(r.file) for r in rows],
+            "start": pd.to_datetime([r.start for r in rows], utc=True),
+            "start_str": [r.start_str for r in rows],
+            "workload_name": [r.workload_name for r in rows],
+            "gen_mode": [r.gen_mode for r in rows],
+            "client_version": [r.client_version or "Unknown" for r in rows],
+            "target_tps": [r.target_tps for r in rows],
+            "achieved_tps": [r.achieved_tps for r in rows],
+            "drop_rate": [r.drop_rate for r in rows],
+            "duration_s": [r.duration_s for r in rows],
+            "workload_config_hash": [r.workload_config_hash for r in rows],
+            "search_blob": [r.search_blob for r in rows],
+        }
+    )
+
+
+@st.cache_data(show_spinner=False)
+def index_rows_by_workload(dir_path: str) -> Dict[str, List[RunRow]]:
+    """Bucket rows by workload name so page reruns look up O(1).
+
+    Buckets preserve the start-descending order of load_reports.
+    """
+    index: Dict[str, List[RunRow]] = {}
+    for row in load_reports(dir_path):
+        index.setdefault(row.workload_name, []).append(row)
+    return index
+
+
+@st.cache_data(show_spinner=False)
+def list_workload_names(dir_path: str) -> Tuple[str, ...]:
+    return tuple(sorted(index_rows_by_workload(dir_path)))
+
+
+@st.cache_data(show_spinner=False)
+def load_run_labels(dir_path: str) -> pd.Series:
+    """Selectbox labels for every run, built once per load instead of per rerun.
+
+    Aligned with load_reports_df's index, so a filtered subset of labels is
+    a plain index lookup with no per-rerun string formatting.
+    """
+    df = load_reports_df(dir_path)
+    version_bounds = compute_version_bounds(df)
+    versions = df["client_version"].map(lambda v: format_version_label(v, version_bounds))
+    hashes = df["workload_config_hash"].str[:8].replace("", "nohash")
+    return (
+        df["start_str"]
+        + " | "
+        + df["workload_name"]
+        + " | "
+        + df["gen_mode"]
+        + " | "
+        + versions
+        + " | "
+        + hashes
+    )
+
+
+def clear_report_caches() -> None:
+    """Drop every cached view of the reports directory (Reload button)."""
+    load_reports.clear()
+    load_reports_df.clear()
+    index_rows_by_workload.clear()
+    list_workload_names.clear()
+    load_run_labels.clear()
+
+
+def compute_version_bounds(df: pd.DataFrame) -> VersionBounds:
+    """Earliest/latest run start per client version, via one groupby."""
+    if df.empty:
+        return {}
+    agg = df.groupby("client_version", sort=False)["start"].agg(["min", "max"])
+    return {
+        version: {
+            "earliest": entry["min"].to_pydatetime(),
+            "latest": entry["max"].to_pydatetime(),
+        }
+        for version, entry in agg.iterrows()
+    }
 
 
 def format_version_label(version: str, bounds: VersionBounds) -> str:
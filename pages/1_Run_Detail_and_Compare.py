@@ -1,12 +1,20 @@
 import json
 import os
 from collections import OrderedDict
-from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 
-from data import RunRow, format_duration, load_reports, DEFAULT_REPORTS_DIR
+from data import (
+    DEFAULT_REPORTS_DIR,
+    RunRow,
+    clear_report_caches,
+    format_duration,
+    index_rows_by_workload,
+    list_workload_names,
+)
 
 def _init_session_state() -> None:
     if "reports_dir" not in st.session_state:
@@ -14,15 +22,7 @@ def _init_session_state() -> None:
 
 
 def _label(row: RunRow) -> str:
-    start = row.start.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M")
-    return f"{start} | {row.workload_name} | {row.gen_mode} | {row.workload_config_hash[:8]}"
-
-
-def _find_row_by_file(rows: List[RunRow], file_path: str) -> Optional[RunRow]:
-    for row in rows:
-        if row.file == file_path:
-            return row
-    return None
+    return f"{row.start_str} | {row.workload_name} | {row.gen_mode} | {row.workload_config_hash[:8]}"
 
 
 def _stat_overall(row: RunRow, key: str) -> Dict[str, float]:
@@ -45,8 +45,9 @@ def _stat_value(row: RunRow, key: str, field: str) -> Optional[float]:
 
 
 def _collect_stat_keys(rows: List[RunRow]) -> List[str]:
-    keys = {k for row in rows for k in row.stats.keys()}
-    return sorted(keys)
+    # One C-level union over the precomputed key sets; avoids decoding
+    # stats_raw for rows whose stats are never rendered.
+    return sorted(frozenset().union(*(row.stat_keys for row in rows)))
 
 
 def _format_percent(value: float) -> str:
@@ -111,12 +112,15 @@ with st.sidebar:
     if reports_dir_input != st.session_state["reports_dir"]:
         st.session_state["reports_dir"] = reports_dir_input
     if st.button("Reload reports"):
-        load_reports.clear()
+        clear_report_caches()
 
 reports_dir = st.session_state["reports_dir"]
-rows = load_reports(reports_dir)
+# The workload index is the only row collection this page reads; checking
+# emptiness through the (tiny) name tuple avoids unpickling the full
+# load_reports value a second time on every rerun.
+workload_names = list(list_workload_names(reports_dir))
 
-if not rows:
+if not workload_names:
     st.title("Run detail & compare")
     st.info("No reports found. Update the reports folder in the sidebar and reload.")
     st.stop()
@@ -134,22 +138,32 @@ if isinstance(match_mode_param, list):
 if match_mode_param not in ("name", "config"):
     match_mode_param = "name"
 
-workload_names = sorted({row.workload_name for row in rows})
 if selected_workload_param not in workload_names:
     selected_workload_param = workload_names[0]
 
 selected_workload = st.selectbox("Workload group", options=workload_names, index=workload_names.index(selected_workload_param))
-workload_rows = [row for row in rows if row.workload_name == selected_workload]
+workload_rows = index_rows_by_workload(reports_dir).get(selected_workload, [])
 if not workload_rows:
     st.warning("No runs for the selected workload group.")
     st.stop()
 
-workload_rows_sorted = sorted(workload_rows, key=lambda r: r.start, reverse=True)
-base_default = _find_row_by_file(workload_rows_sorted, selected_file_param) or workload_rows_sorted[0]
+# Buckets from index_rows_by_workload preserve load_reports' start-descending
+# order, so no re-sort is needed here.
+workload_rows_sorted = workload_rows
+file_to_row = {row.file: row for row in workload_rows_sorted}
+base_default = file_to_row.get(selected_file_param) or workload_rows_sorted[0]
 
+# Labels are built once per rerun and shared by the baseline selectbox and
+# both advanced-filter multiselects below; they stay position-aligned with
+# workload_rows_sorted.
 base_label_options = [_label(r) for r in workload_rows_sorted]
-base_label_default = base_label_options.index(_label(base_default))
-base_label = st.selectbox("Baseline run", options=base_label_options, index=base_label_default)
+label_by_file = dict(zip((r.file for r in workload_rows_sorted), base_label_options))
+row_position = {row.file: idx for idx, row in enumerate(workload_rows_sorted)}
+base_label = st.selectbox(
+    "Baseline run",
+    options=base_label_options,
+    index=row_position[base_default.file],
+)
 label_to_row = {label: row for label, row in zip(base_label_options, workload_rows_sorted)}
 base_run = label_to_row[base_label]
 
@@ -166,7 +180,7 @@ st.title("Run detail & comparison")
 
 primary_cols = st.columns(4)
 with primary_cols[0]:
-    st.metric("Run start", base_run.start.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M"))
+    st.metric("Run start", base_run.start_str)
 with primary_cols[1]:
     st.metric("Duration", format_duration(base_run.duration_s))
 with primary_cols[2]:
@@ -202,13 +216,17 @@ advanced = st.expander("Advanced filters", expanded=False)
 with advanced:
     manual_include_labels = st.multiselect(
         "Force include runs",
-        options=[_label(r) for r in workload_rows_sorted if r.file != base_run.file],
+        options=[
+            label
+            for label, row in zip(base_label_options, workload_rows_sorted)
+            if row.file != base_run.file
+        ],
         default=[],
         key=f"manual_include_{base_key}",
     )
     manual_exclude_labels = st.multiselect(
         "Exclude runs",
-        options=[_label(r) for r in matching_rows],
+        options=[label_by_file[r.file] for r in matching_rows],
         default=[],
         key=f"manual_exclude_{base_key}",
     )
@@ -249,47 +267,42 @@ else:
     )
 comparison_rows = comparison_rows[:comparison_limit]
 
-comparison_table: List[Dict[str, object]] = []
-comparison_table.append(
-    {
-        "Role": "Baseline",
-        "Start": base_run.start.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M"),
-        "Target TPS": base_run.target_tps,
-        "Achieved TPS": round(base_run.achieved_tps, 2),
-        "Drop rate": _format_percent(base_run.drop_rate),
-        "Report file": os.path.basename(base_run.file),
-        "Regression": "",
-    }
-)
+# Build the table column-wise with the delta arithmetic done in NumPy, then
+# assemble one DataFrame instead of appending a dict per row.
+n_compare = len(comparison_rows)
+tps_arr = np.fromiter((r.achieved_tps for r in comparison_rows), dtype=np.float64, count=n_compare)
+drop_arr = np.fromiter((r.drop_rate for r in comparison_rows), dtype=np.float64, count=n_compare)
 
-for row in comparison_rows:
-    entry: Dict[str, object] = {
-        "Role": "Comparison",
-        "Start": row.start.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M"),
-        "Target TPS": row.target_tps,
-        "Achieved TPS": f"{row.achieved_tps:.2f} ({_format_delta_percent(base_run.achieved_tps, row.achieved_tps)})",
-        "Drop rate": f"{_format_percent(row.drop_rate)} ({_format_delta_pp(base_run.drop_rate, row.drop_rate)})",
-        "Report file": os.path.basename(row.file),
-        "Regression": _regression_notes(base_run, row, stat_key),
-    }
-    if stat_key:
-        base_p90 = _stat_value(base_run, stat_key, "p90")
-        row_p90 = _stat_value(row, stat_key, "p90")
-        entry[f"{stat_key} p90"] = (
-            "n/a"
-            if row_p90 is None or base_p90 is None
-            else f"{row_p90:.3f} ({_format_delta_percent(base_p90, row_p90)})"
-        )
-        base_p50 = _stat_value(base_run, stat_key, "p50")
-        row_p50 = _stat_value(row, stat_key, "p50")
-        entry[f"{stat_key} p50"] = (
+if base_run.achieved_tps > 0:
+    tps_pct = (tps_arr - base_run.achieved_tps) / base_run.achieved_tps * 100.0
+    tps_cells = [f"{v:.2f} ({p:+.1f}%)" for v, p in zip(tps_arr, tps_pct)]
+else:
+    tps_cells = [f"{v:.2f} (—)" for v in tps_arr]
+drop_pp = (drop_arr - base_run.drop_rate) * 100.0
+drop_cells = [f"{d * 100:.2f}% ({pp:+.2f}pp)" for d, pp in zip(drop_arr, drop_pp)]
+
+comparison_table: Dict[str, List[object]] = {
+    "Role": ["Baseline"] + ["Comparison"] * n_compare,
+    "Start": [base_run.start_str] + [r.start_str for r in comparison_rows],
+    "Target TPS": [base_run.target_tps] + [r.target_tps for r in comparison_rows],
+    "Achieved TPS": [round(base_run.achieved_tps, 2)] + tps_cells,
+    "Drop rate": [_format_percent(base_run.drop_rate)] + drop_cells,
+    "Report file": [os.path.basename(base_run.file)]
+    + [os.path.basename(r.file) for r in comparison_rows],
+    "Regression": [""] + [_regression_notes(base_run, r, stat_key) for r in comparison_rows],
+}
+if stat_key:
+    for field in ("p90", "p50"):
+        base_val = _stat_value(base_run, stat_key, field)
+        values = [_stat_value(r, stat_key, field) for r in comparison_rows]
+        comparison_table[f"{stat_key} {field}"] = [None] + [
             "n/a"
-            if row_p50 is None or base_p50 is None
-            else f"{row_p50:.3f} ({_format_delta_percent(base_p50, row_p50)})"
-        )
-    comparison_table.append(entry)
+            if val is None or base_val is None
+            else f"{val:.3f} ({_format_delta_percent(base_val, val)})"
+            for val in values
+        ]
 
-st.dataframe(comparison_table, use_container_width=True, hide_index=True)
+st.dataframe(pd.DataFrame(comparison_table), use_container_width=True, hide_index=True)
 
 st.write("### Baseline stats")
 if not base_run.stats:
@@ -1,4 +1,3 @@
-import statistics
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -7,11 +6,11 @@ import streamlit as st
 
 from data import (
     DEFAULT_REPORTS_DIR,
-    RunRow,
+    clear_report_caches,
     compute_version_bounds,
     format_duration,
     format_version_label,
-    load_reports,
+    load_reports_df,
 )
 
 
@@ -91,27 +90,29 @@ def _make_delta_styler(values: List[Optional[float]], positive_good: bool):
     return _styler
 
 
-def _compute_version_workload_stats(rows: List[RunRow]) -> Dict[str, Dict[str, Dict[str, object]]]:
+def _compute_version_workload_stats(df: pd.DataFrame) -> Dict[str, Dict[str, Dict[str, object]]]:
+    # One vectorized groupby replaces the per-row Python loops and the
+    # per-bucket statistics.median calls; only the small (version, workload)
+    # result grid is walked in Python to keep the nested-dict shape the
+    # table builders consume.
     stats: Dict[str, Dict[str, Dict[str, object]]] = {}
-    for row in rows:
-        version = row.client_version or "Unknown"
-        version_stats = stats.setdefault(version, {})
-        workload_rows = version_stats.setdefault(row.workload_name, {}).setdefault("rows", [])
-        workload_rows.append(row)
-    for version, workloads in stats.items():
-        for workload, payload in workloads.items():
-            workload_rows = payload["rows"]
-            workload_rows.sort(key=lambda r: r.start, reverse=True)
-            payload.clear()
-            payload.update(
-                {
-                    "runs": len(workload_rows),
-                    "median_tps": statistics.median([r.achieved_tps for r in workload_rows]) if workload_rows else None,
-                    "median_drop": statistics.median([r.drop_rate for r in workload_rows]) if workload_rows else None,
-                    "median_duration": statistics.median([r.duration_s for r in workload_rows]) if workload_rows else None,
-                    "latest": workload_rows[0].start if workload_rows else None,
-                }
-            )
+    if df.empty:
+        return stats
+    grouped = df.groupby(["client_version", "workload_name"], sort=False).agg(
+        runs=("achieved_tps", "size"),
+        median_tps=("achieved_tps", "median"),
+        median_drop=("drop_rate", "median"),
+        median_duration=("duration_s", "median"),
+        latest=("start", "max"),
+    )
+    for (version, workload), entry in grouped.iterrows():
+        stats.setdefault(version, {})[workload] = {
+            "runs": int(entry["runs"]),
+            "median_tps": float(entry["median_tps"]),
+            "median_drop": float(entry["median_drop"]),
+            "median_duration": float(entry["median_duration"]),
+            "latest": entry["latest"].to_pydatetime(),
+        }
     return stats
 
 
@@ -205,17 +206,17 @@ with st.sidebar:
     if reports_dir_input != st.session_state["reports_dir"]:
         st.session_state["reports_dir"] = reports_dir_input
     if st.button("Reload reports"):
-        load_reports.clear()
+        clear_report_caches()
 
 reports_dir = st.session_state["reports_dir"]
-rows = load_reports(reports_dir)
+df = load_reports_df(reports_dir)
 
-if not rows:
+if df.empty:
     st.title("Client version medians")
     st.info("No reports found. Update the reports folder in the sidebar and reload.")
     st.stop()
 
-version_bounds = compute_version_bounds(rows)
+version_bounds = compute_version_bounds(df)
 version_order = sorted(
     version_bounds.keys(), key=lambda v: version_bounds[v]["latest"], reverse=True
 )
@@ -235,7 +236,7 @@ comparison_versions = st.multiselect(
 )
 
 selected_versions = [reference_version] + comparison_versions
-stats = _compute_version_workload_stats(rows)
+stats = _compute_version_workload_stats(df)
 
 workload_pool = sorted({workload for version in selected_versions for workload in stats.get(version, {})})
 if not workload_pool: